@@ -171,7 +171,7 @@ def model_defaults(config):
 
     if KEY.READOUT_AS_FCN not in config:
         config[KEY.READOUT_AS_FCN] = defaults[KEY.READOUT_AS_FCN]
-    if config[KEY.READOUT_AS_FCN] is False:
+    if not config[KEY.READOUT_AS_FCN]:
         defaults.pop(KEY.READOUT_FCN_ACTIVATION, None)
         defaults.pop(KEY.READOUT_FCN_HIDDEN_NEURONS, None)
 
@@ -144,6 +144,7 @@ class SevenNetCalculator(Calculator):
         self.model.eval()
 
         self.modal = modal
+        self._z_to_onehot = None  # built lazily from type_map
 
         self.implemented_properties = [
             'free_energy',
@@ -153,16 +154,27 @@ class SevenNetCalculator(Calculator):
             'energies',
         ]
 
-    def set_atoms(self, atoms):
-        # called by ase, when atoms.calc = calc
-        zs = tuple(set(atoms.get_atomic_numbers()))
-        for z in zs:
+    def _check_known_species(self, atomic_numbers) -> None:
+        for z in set(atomic_numbers):
             if z not in self.type_map:
                 sp = list(self.type_map.keys())
                 raise ValueError(
                     f'Model do not know atomic number: {z}, (knows: {sp})'
                 )
 
+    def _onehot_indices(self, atomic_numbers: torch.Tensor) -> torch.Tensor:
+        # single gather instead of per-atom .item() calls (each is a host sync)
+        if self._z_to_onehot is None:
+            lut = torch.full((max(self.type_map) + 1,), -1, dtype=torch.int64)
+            for z, onehot_idx in self.type_map.items():
+                lut[z] = onehot_idx
+            self._z_to_onehot = lut.to(self.device)
+        return self._z_to_onehot[atomic_numbers]
+
+    def set_atoms(self, atoms):
+        # called by ase, when atoms.calc = calc
+        self._check_known_species(atoms.get_atomic_numbers())
+
     def calculate(self, atoms=None, properties=None, system_changes=all_changes):
         # call parent class to set necessary atom attributes
         Calculator.calculate(self, atoms, properties, system_changes)
@@ -176,11 +188,10 @@ class SevenNetCalculator(Calculator):
         data.to(self.device)  # type: ignore
 
         if isinstance(self.model, torch_script_type):
-            data[KEY.NODE_FEATURE] = torch.tensor(
-                [self.type_map[z.item()] for z in data[KEY.NODE_FEATURE]],
-                dtype=torch.int64,
-                device=self.device,
-            )
+            # validate on host, the gather would turn an unknown species
+            # into a wrong (or out-of-range) one-hot index
+            self._check_known_species(atoms.get_atomic_numbers())
+            data[KEY.NODE_FEATURE] = self._onehot_indices(data[KEY.NODE_FEATURE])
             data[KEY.POS].requires_grad_(True)  # backward compatibility
             data[KEY.EDGE_VEC].requires_grad_(True)  # backward compatibility
             data = data.to_dict()
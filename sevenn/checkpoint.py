@@ -68,9 +68,11 @@ def _config_cp_routine(config):
             warnings.warn(f'{k} not in config, use default value {v}', UserWarning)
         config[k] = v
 
-    for k, v in config.items():
-        if isinstance(v, Tensor):
-            config[k] = v.cpu()
+    # tensors are rare in config, collect keys first instead of
+    # rewriting values while iterating the dict
+    tensor_keys = [k for k, v in config.items() if isinstance(v, Tensor)]
+    for k in tensor_keys:
+        config[k] = config[k].cpu()
     return config
 
 
@@ -262,7 +264,15 @@ class SevenNetCheckpoint:
         assert not self._loaded
         cp_path = self.checkpoint_path  # just alias
 
-        cp = torch_load(cp_path, weights_only=False, map_location='cpu')
+        try:
+            # mmap avoids reading multi-GB checkpoints into RAM up front and
+            # weights_only skips the full pickle machinery
+            cp = torch_load(
+                cp_path, map_location='cpu', weights_only=True, mmap=True
+            )
+        except Exception:
+            # old checkpoints pickle custom classes (or torch has no mmap arg)
+            cp = torch_load(cp_path, weights_only=False, map_location='cpu')
         self._config_original = cp.get('config', {})
         self._model_state_dict = cp.get('model_state_dict', {})
         self._optimizer_state_dict = cp.get('optimizer_state_dict', {})
@@ -60,6 +60,48 @@ def get_err_type(name: str) -> dict[str, Any]:
     return deepcopy(_ERROR_TYPES[name])
 
 
+def _vector_square_error_eager(
+    y_ref: torch.Tensor, y_pred: torch.Tensor, vdim: int
+) -> torch.Tensor:
+    diff = y_ref.reshape(-1, vdim) - y_pred.reshape(-1, vdim)
+    return (diff * diff).sum(dim=1)
+
+
+_vse_impl = None  # resolved on first call
+
+
+def _vector_square_error(
+    y_ref: torch.Tensor, y_pred: torch.Tensor, vdim: int
+) -> torch.Tensor:
+    """
+    Called every batch, torch.compile fuses it into a single kernel with
+    dynamic=True to avoid recompiles for varying batch sizes. Compilation
+    is attempted lazily on the first call and silently degrades to eager
+    wherever dynamo or the inductor backend is unavailable (old torch,
+    unsupported python version, no host compiler)
+    """
+    global _vse_impl
+    if _vse_impl is None:
+        _vse_impl = _vector_square_error_eager
+        if hasattr(torch, 'compile'):
+            try:
+                compiled = torch.compile(
+                    _vector_square_error_eager, dynamic=True
+                )
+                ret = compiled(y_ref, y_pred, vdim)
+                _vse_impl = compiled
+                return ret
+            except Exception:
+                pass
+    try:
+        return _vse_impl(y_ref, y_pred, vdim)
+    except Exception:
+        if _vse_impl is _vector_square_error_eager:
+            raise
+        _vse_impl = _vector_square_error_eager  # later recompile failed
+        return _vse_impl(y_ref, y_pred, vdim)
+
+
 def _get_loss_function_from_name(loss_functions, name):
     for loss_def, w in loss_functions:
         if loss_def.name.lower() == name.lower():
@@ -73,20 +115,62 @@ class AverageNumber:
         self._count = 0
 
     def update(self, values: torch.Tensor):
-        self._sum += values.sum().item()
+        # keep the sum on device, materializing it here would block the host
+        self._sum = self._sum + values.detach().sum()
         self._count += values.numel()
 
+    def _materialize(self):
+        # pay the host-device sync only when the value is actually needed
+        if isinstance(self._sum, torch.Tensor):
+            self._sum = self._sum.item()
+
+    def _ddp_reduce_async(self, device):
+        """
+        Issue the collective without blocking, overlap it with host work
+        and finish with _ddp_reduce_wait
+        """
+        self._materialize()
+        # pack sum and count into one tensor to launch a single collective
+        buf = torch.tensor(
+            [self._sum, self._count], dtype=torch.float64, device=device
+        )
+        handle = dist.all_reduce(buf, op=dist.ReduceOp.SUM, async_op=True)
+        return buf, handle
+
+    def _ddp_reduce_wait(self, buf, handle):
+        handle.wait()
+        _sum, _count = buf.tolist()
+        self._sum = _sum
+        self._count = int(_count)
+
     def _ddp_reduce(self, device):
-        _sum = torch.tensor(self._sum, device=device)
-        _count = torch.tensor(self._count, device=device)
-        dist.all_reduce(_sum, op=dist.ReduceOp.SUM)
-        dist.all_reduce(_count, op=dist.ReduceOp.SUM)
-        self._sum = _sum.item()
-        self._count = _count.item()
+        buf, handle = self._ddp_reduce_async(device)
+        self._ddp_reduce_wait(buf, handle)
+
+    @classmethod
+    def reduce_many(cls, avgs: List['AverageNumber'], device):
+        """
+        All-reduce many instances with a single (N, 2) collective,
+        latency dominates bandwidth for these scalar-sized messages
+        """
+        if len(avgs) == 0:
+            return
+        for avg in avgs:
+            avg._materialize()
+        buf = torch.tensor(
+            [[avg._sum, avg._count] for avg in avgs],
+            dtype=torch.float64,
+            device=device,
+        )
+        dist.all_reduce(buf, op=dist.ReduceOp.SUM)
+        for avg, (_sum, _count) in zip(avgs, buf.tolist()):
+            avg._sum = _sum
+            avg._count = int(_count)
 
     def get(self):
         if self._count == 0:
             return torch.nan
+        self._materialize()
         return self._sum / self._count
 
 
@@ -136,6 +220,10 @@ class ErrorMetric:
     def ddp_reduce(self, device):
         self.value._ddp_reduce(device)
 
+    def _averages(self) -> List[AverageNumber]:
+        # AverageNumbers to include in a batched DDP reduction
+        return [self.value]
+
     def reset(self):
         self.value = AverageNumber()
 
@@ -160,10 +248,9 @@ class RMSError(ErrorMetric):
     def __init__(self, vdim: int = 1, **kwargs):
         super().__init__(**kwargs)
         self.vdim = vdim
-        self._se = torch.nn.MSELoss(reduction='none')
 
     def _square_error(self, y_ref, y_pred, vdim: int):
-        return self._se(y_ref.view(-1, vdim), y_pred.view(-1, vdim)).sum(dim=1)
+        return _vector_square_error(y_ref, y_pred, vdim)
 
     def update(self, output: AtomGraphData):
         y_ref, y_pred = self._retrieve(output)
@@ -182,15 +269,12 @@ class ComponentRMSError(ErrorMetric):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._se = torch.nn.MSELoss(reduction='none')
 
     def _square_error(self, y_ref, y_pred):
-        return self._se(y_ref, y_pred)
+        return _vector_square_error(y_ref, y_pred, 1)
 
     def update(self, output: AtomGraphData):
         y_ref, y_pred = self._retrieve(output)
-        y_ref = y_ref.view(-1)
-        y_pred = y_pred.view(-1)
         se = self._square_error(y_ref, y_pred)
         self.value.update(se)
 
@@ -211,8 +295,8 @@ class MAError(ErrorMetric):
 
     def update(self, output: AtomGraphData):
         y_ref, y_pred = self._retrieve(output)
-        y_ref = y_ref.reshape((-1,))
-        y_pred = y_pred.reshape((-1,))
+        y_ref = y_ref.reshape(-1)
+        y_pred = y_pred.reshape(-1)
         se = self._square_error(y_ref, y_pred)
         self.value.update(se)
 
@@ -278,8 +362,10 @@ class CombinedError(ErrorMetric):
             metric.reset()
 
     def ddp_reduce(self, device):  # override
-        for metric, _ in self.metrics:
-            metric.value._ddp_reduce(device)
+        AverageNumber.reduce_many(self._averages(), device)
+
+    def _averages(self) -> List[AverageNumber]:  # override
+        return [metric.value for metric, _ in self.metrics]
 
     def get(self):
         val = 0.0
@@ -331,7 +417,7 @@ class ErrorRecorder:
 
     def get_dct(self, prefix=''):
         dct = {}
-        if prefix.endswith('_') is False and prefix != '':
+        if not prefix.endswith('_') and prefix != '':
             prefix = prefix + '_'
         for metric in self.metrics:
             dct[f'{prefix}{metric.name}'] = f'{metric.get():6f}'
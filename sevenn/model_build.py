@@ -96,7 +96,7 @@ def init_edge_embedding(config):
 def init_feature_reduce(config, irreps_x):
     # features per node to scalar per node
     layers = OrderedDict()
-    if config[KEY.READOUT_AS_FCN] is False:
+    if not config[KEY.READOUT_AS_FCN]:
         hidden_irreps = Irreps([(irreps_x.dim // 2, (0, 1))])
         layers.update(
             {
@@ -33,7 +33,8 @@ class EdgePreprocess(nn.Module):
         batch = data[KEY.BATCH]  # for deploy, must be defined first
         if self.is_stress:
             if self._is_batch_data:
-                num_batch = int(batch.max().cpu().item()) + 1
+                # batch count from cell shape, avoids a device sync per call
+                num_batch = cell.shape[0]
                 strain = torch.zeros(
                     (num_batch, 3, 3),
                     dtype=pos.dtype,
@@ -209,7 +209,8 @@ class ForceStressOutputFromEdge(nn.Module):
 
             if self._is_batch_data:
                 batch = data[KEY.BATCH]  # for deploy, must be defined first
-                nbatch = int(batch.max().cpu().item()) + 1
+                # batch count from num_atoms shape, avoids a device sync
+                nbatch = data[KEY.NUM_ATOMS].shape[0]
                 sout = torch.zeros(
                     (nbatch, 6), dtype=_virial.dtype, device=_virial.device
                 )
@@ -4,12 +4,34 @@ keep old pre-trained checkpoints unchanged.
 """
 
 import copy
+import re
 
 import torch
 
 import sevenn._keys as KEY
 
 
+def _build_old_module_name_mapping():
+    mapping = {
+        'EdgeEmbedding': 'edge_embedding',
+        'reducing nn input to hidden': 'reduce_input_to_hidden',
+        'reducing nn hidden to energy': 'reduce_hidden_to_energy',
+        'rescale atomic energy': 'rescale_atomic_energy',
+    }
+    for i in range(10):
+        mapping[f'{i} self connection intro'] = f'{i}_self_connection_intro'
+        mapping[f'{i} convolution'] = f'{i}_convolution'
+        mapping[f'{i} self interaction 2'] = f'{i}_self_interaction_2'
+        mapping[f'{i} equivariant gate'] = f'{i}_equivariant_gate'
+    return mapping
+
+
+_OLD_MODULE_NAME_MAPPING = _build_old_module_name_mapping()
+_OLD_MODULE_NAME_PAT = re.compile(
+    '^(' + '|'.join(re.escape(k) for k in _OLD_MODULE_NAME_MAPPING) + r')\.'
+)
+
+
 def version_tuple(v1):
     v1 = tuple(map(int, v1.split('.')))
     return v1
@@ -46,33 +68,21 @@ def map_old_model(old_model_state_dict):
     For compatibility with old namings (before 'correct' branch merged 2404XX)
     Map old model's module names to new model's module names
     """
-    _old_module_name_mapping = {
-        'EdgeEmbedding': 'edge_embedding',
-        'reducing nn input to hidden': 'reduce_input_to_hidden',
-        'reducing nn hidden to energy': 'reduce_hidden_to_energy',
-        'rescale atomic energy': 'rescale_atomic_energy',
-    }
-    for i in range(10):
-        _old_module_name_mapping[f'{i} self connection intro'] = (
-            f'{i}_self_connection_intro'
-        )
-        _old_module_name_mapping[f'{i} convolution'] = f'{i}_convolution'
-        _old_module_name_mapping[f'{i} self interaction 2'] = (
-            f'{i}_self_interaction_2'
-        )
-        _old_module_name_mapping[f'{i} equivariant gate'] = f'{i}_equivariant_gate'
+    if not any(
+        _OLD_MODULE_NAME_PAT.match(k) or 'denumerator' in k
+        for k in old_model_state_dict
+    ):
+        # already new-style naming, skip the per-key rewrite entirely
+        return old_model_state_dict
 
     new_model_state_dict = {}
     for k, v in old_model_state_dict.items():
-        key_name = k.split('.')[0]
-        follower = '.'.join(k.split('.')[1:])
-        if 'denumerator' in follower:
-            follower = follower.replace('denumerator', 'denominator')
-        if key_name in _old_module_name_mapping:
-            new_key_name = _old_module_name_mapping[key_name] + '.' + follower
-            new_model_state_dict[new_key_name] = v
-        else:
-            new_model_state_dict[k] = v
+        new_k, n_sub = _OLD_MODULE_NAME_PAT.subn(
+            lambda m: _OLD_MODULE_NAME_MAPPING[m.group(1)] + '.', k
+        )
+        if n_sub:  # old naming, may also carry the denumerator typo
+            new_k = new_k.replace('denumerator', 'denominator')
+        new_model_state_dict[new_k] = v
     return new_model_state_dict
 
 
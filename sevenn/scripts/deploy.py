@@ -64,7 +64,7 @@ def deploy(checkpoint, fname='deployed_serial.pt', modal: Optional[str] = None):
     md_configs.update({'dtype': config.pop(KEY.DTYPE, 'single')})
     md_configs.update({'time': datetime.now().strftime('%Y-%m-%d')})
 
-    if fname.endswith('.pt') is False:
+    if not fname.endswith('.pt'):
         fname += '.pt'
     torch.jit.save(model, fname, _extra_files=md_configs)
 
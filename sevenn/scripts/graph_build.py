@@ -59,7 +59,7 @@ def dataset_finalize(dataset, metadata, out):
 
     if os.path.isdir(out):
         out = os.path.join(out, 'graph_built.sevenn_data')
-    elif out.endswith('.sevenn_data') is False:
+    elif not out.endswith('.sevenn_data'):
         out = out + '.sevenn_data'
     out = unique_filepath(out)
 
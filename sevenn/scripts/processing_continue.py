@@ -125,7 +125,7 @@ def check_config_compatible(config, config_cp):
     TRAINABLE_CONFIGS = [KEY.TRAIN_DENOMINTAOR, KEY.TRAIN_SHIFT_SCALE]
     if (
         any((not cntdct[KEY.RESET_SCHEDULER], not cntdct[KEY.RESET_OPTIMIZER]))
-        and all(config[k] == config_cp[k] for k in TRAINABLE_CONFIGS) is False
+        and not all(config[k] == config_cp[k] for k in TRAINABLE_CONFIGS)
     ):
         raise ValueError(
             'reset optimizer and scheduler if you want to change '
@@ -364,9 +364,9 @@ def processing_dataset(config, working_dir):
     save_dataset = config[KEY.SAVE_DATASET]
     save_by_label = config[KEY.SAVE_BY_LABEL]
     if save_dataset:
-        if save_dataset.endswith('.sevenn_data') is False:
+        if not save_dataset.endswith('.sevenn_data'):
             save_dataset += '.sevenn_data'
-        if (save_dataset.startswith('.') or save_dataset.startswith('/')) is False:
+        if not (save_dataset.startswith('.') or save_dataset.startswith('/')):
             save_dataset = prefix + save_dataset  # save_data set is plain file name
         dataset.save(save_dataset)
         log.format_k_v('Dataset saved to', save_dataset, write=True)
@@ -392,7 +392,7 @@ def processing_dataset(config, working_dir):
         # condition: validset labels should be subset of trainset labels
         valid_labels = valid_set.user_labels
         train_labels = train_set.user_labels
-        if set(valid_labels).issubset(set(train_labels)) is False:
+        if not set(valid_labels).issubset(set(train_labels)):
             valid_set = AtomGraphDataset(valid_set.to_list(), cutoff)
             valid_set.rewrite_labels_to_data()
             train_set = AtomGraphDataset(train_set.to_list(), cutoff)
@@ -409,7 +409,7 @@ def processing_dataset(config, working_dir):
             config_modality = config[KEY.MODAL_LIST]
             valid_modality = valid_set.get_modalities()
 
-            if set(valid_modality).issubset(set(config_modality)) is False:
+            if not set(valid_modality).issubset(set(config_modality)):
                 raise ValueError('validset modality is not subset of trainset')
 
             valid_set.write_modal_attr(
@@ -457,9 +457,9 @@ def processing_dataset(config, working_dir):
     _, _ = train_set.separate_info()
     _, _ = valid_set.separate_info()
 
-    if train_set.x_is_one_hot_idx is False:
+    if not train_set.x_is_one_hot_idx:
         train_set.x_to_one_hot_idx(config[KEY.TYPE_MAP])
-    if valid_set.x_is_one_hot_idx is False:
+    if not valid_set.x_is_one_hot_idx:
         valid_set.x_to_one_hot_idx(config[KEY.TYPE_MAP])
 
     log.format_k_v('training_set size', train_set.len(), write=True)
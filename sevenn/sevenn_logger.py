@@ -250,7 +250,7 @@ class Logger(metaclass=Singleton):
             content = content[: -len(SEPARATOR)]
         content += '\n'
 
-        if write is False:
+        if not write:
             return content
         else:
             self.write(content)
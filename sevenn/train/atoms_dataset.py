@@ -180,7 +180,7 @@ class SevenNetAtomsDataset(torch.utils.data.Dataset):
         Unlink SevenNetGraphDataset, neighbors count is not computed as
         it requires to build graph
         """
-        if self._scanned is True:
+        if self._scanned:
             return  # statistics already computed
         y_keys: List[str] = [KEY.ENERGY, KEY.PER_ATOM_ENERGY, KEY.FORCE, KEY.STRESS]
         natoms_counter = Counter()
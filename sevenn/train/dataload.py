@@ -388,9 +388,9 @@ def structure_list_reader(filename: str, format_outputs: Optional[str] = None):
 
     def parse_label(line):
         line = line.strip()
-        if line.startswith('[') is False:
+        if not line.startswith('['):
             return False
-        elif line.endswith(']') is False:
+        elif not line.endswith(']'):
             raise ValueError('wrong structure_list title format')
         return line[1:-1]
 
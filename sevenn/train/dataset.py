@@ -110,7 +110,7 @@ class AtomGraphDataset:
         data_list = self.to_list()
         info_list = []
         for datum in data_list:
-            if data_key in datum is False:
+            if data_key not in datum:
                 continue
             info_list.append(datum[data_key])
             del datum[data_key]  # It does change the self.dataset
@@ -204,7 +204,7 @@ class AtomGraphDataset:
         after this process, the dataset has dependency on type_map
         or chemical species user want to consider
         """
-        assert self.x_is_one_hot_idx is False
+        assert not self.x_is_one_hot_idx
         for data_list in self.dataset.values():
             for datum in data_list:
                 datum[self.DATA_KEY_X] = torch.LongTensor(
@@ -283,7 +283,7 @@ class AtomGraphDataset:
         type_map: Z->one_hot_index(node_feature)
         return Dict{label: {symbol, natom}]}
         """
-        assert not (self.x_is_one_hot_idx is True and type_map is None)
+        assert not (self.x_is_one_hot_idx and type_map is None)
         natoms = {}
         for label, data in self.dataset.items():
             natoms[label] = Counter()
@@ -324,7 +324,7 @@ class AtomGraphDataset:
         x should be one-hot-indexed
         give num_chem_species if possible
         """
-        assert self.x_is_one_hot_idx is True
+        assert self.x_is_one_hot_idx
         data_list = self.to_list()
 
         c = torch.zeros((len(data_list), num_chem_species))
@@ -365,7 +365,7 @@ class AtomGraphDataset:
         Return force rms for each species
         Averaged by each components (x, y, z)
         """
-        assert self.x_is_one_hot_idx is True
+        assert self.x_is_one_hot_idx
         data_list = self.to_list()
 
         atomx = torch.concat([d[self.DATA_KEY_X] for d in data_list])
@@ -491,6 +491,6 @@ class AtomGraphDataset:
                     f'{path}/{label}.sevenn_data',
                 )
         else:
-            if path.endswith('.sevenn_data') is False:
+            if not path.endswith('.sevenn_data'):
                 path += '.sevenn_data'
             torch.save(self, path)
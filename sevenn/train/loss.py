@@ -42,8 +42,8 @@ class LossDefinition:
     ) -> Tuple[torch.Tensor, torch.Tensor, Optional[torch.Tensor]]:
         if self.pred_key is None or self.ref_key is None:
             raise NotImplementedError('LossDefinition is not implemented.')
-        pred = torch.reshape(batch_data[self.pred_key], (-1,))
-        ref = torch.reshape(batch_data[self.ref_key], (-1,))
+        pred = batch_data[self.pred_key].reshape(-1)
+        ref = batch_data[self.ref_key].reshape(-1)
         return pred, ref, None
 
     def _ignore_unlabeled(self, pred, ref, data_weights=None):
@@ -142,8 +142,8 @@ class ForceLoss(LossDefinition):
         self, batch_data: Dict[str, Any], model: Optional[Callable] = None
     ):
         assert isinstance(self.pred_key, str) and isinstance(self.ref_key, str)
-        pred = torch.reshape(batch_data[self.pred_key], (-1,))
-        ref = torch.reshape(batch_data[self.ref_key], (-1,))
+        pred = batch_data[self.pred_key].reshape(-1)
+        ref = batch_data[self.ref_key].reshape(-1)
         w_tensor = None
 
         if self.use_weight:
@@ -184,8 +184,9 @@ class StressLoss(LossDefinition):
     ):
         assert isinstance(self.pred_key, str) and isinstance(self.ref_key, str)
 
-        pred = torch.reshape(batch_data[self.pred_key] * self.TO_KB, (-1,))
-        ref = torch.reshape(batch_data[self.ref_key] * self.TO_KB, (-1,))
+        # the multiply output is contiguous, so the flatten is always a view
+        pred = (batch_data[self.pred_key] * self.TO_KB).view(-1)
+        ref = (batch_data[self.ref_key] * self.TO_KB).view(-1)
         w_tensor = None
 
         if self.use_weight:
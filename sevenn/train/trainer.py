@@ -10,7 +10,7 @@ from torch.nn.parallel import DistributedDataParallel as DDP
 from tqdm import tqdm
 
 import sevenn._keys as KEY
-from sevenn.error_recorder import ErrorRecorder
+from sevenn.error_recorder import AverageNumber, ErrorRecorder
 from sevenn.train.loss import LossDefinition
 
 from .loss import get_loss_functions_from_config
@@ -185,9 +185,11 @@ class Trainer:
         return float(self.optimizer.param_groups[0]['lr'])
 
     def recorder_all_reduce(self, recorder: ErrorRecorder) -> None:
+        # one collective for all metrics instead of one (or two) per metric
+        avgs = []
         for metric in recorder.metrics:
-            # metric.value._ddp_reduce(self.device)
-            metric.ddp_reduce(self.device)
+            avgs.extend(metric._averages())
+        AverageNumber.reduce_many(avgs, self.device)
 
     def get_checkpoint_dict(self) -> dict:
         if self.distributed:
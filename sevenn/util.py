@@ -1,12 +1,15 @@
+import functools
 import os
 import pathlib
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
 import torch.nn
+from ase.data import atomic_numbers, chemical_symbols
 from e3nn.o3 import FullTensorProduct, Irreps
 
+import sevenn._const as _const
 import sevenn._keys as KEY
 from sevenn.checkpoint import SevenNetCheckpoint
 
@@ -23,23 +26,21 @@ def to_atom_graph_list(atom_graph_batch):
 
     indices = atom_graph_batch[KEY.NUM_ATOMS].tolist()
 
-    atomic_energy_list = torch.split(atom_graph_batch[KEY.ATOMIC_ENERGY], indices)
-    inferred_total_energy_list = torch.unbind(
-        atom_graph_batch[KEY.PRED_TOTAL_ENERGY]
-    )
-    inferred_force_list = torch.split(atom_graph_batch[KEY.PRED_FORCE], indices)
-
-    inferred_stress_list = None
-    if is_stress:
-        inferred_stress_list = torch.unbind(atom_graph_batch[KEY.PRED_STRESS])
+    atomic_energy = atom_graph_batch[KEY.ATOMIC_ENERGY]
+    inferred_total_energy = atom_graph_batch[KEY.PRED_TOTAL_ENERGY]
+    inferred_force = atom_graph_batch[KEY.PRED_FORCE]
+    inferred_stress = atom_graph_batch[KEY.PRED_STRESS] if is_stress else None
 
+    start = 0
     for i, data in enumerate(data_list):
-        data[KEY.ATOMIC_ENERGY] = atomic_energy_list[i]
-        data[KEY.PRED_TOTAL_ENERGY] = inferred_total_energy_list[i]
-        data[KEY.PRED_FORCE] = inferred_force_list[i]
+        end = start + indices[i]
+        data[KEY.ATOMIC_ENERGY] = atomic_energy[start:end]
+        data[KEY.PRED_TOTAL_ENERGY] = inferred_total_energy[i]
+        data[KEY.PRED_FORCE] = inferred_force[start:end]
         # To fit with KEY.STRESS (ref) format
-        if is_stress and inferred_stress_list is not None:
-            data[KEY.PRED_STRESS] = torch.unsqueeze(inferred_stress_list[i], 0)
+        if inferred_stress is not None:
+            data[KEY.PRED_STRESS] = inferred_stress[i].unsqueeze(0)
+        start = end
     return data_list
 
 
@@ -74,47 +75,62 @@ def error_recorder_from_loss_functions(loss_functions):
     return ErrorRecorder(metrics)
 
 
-def onehot_to_chem(one_hot_indices: List[int], type_map: Dict[int, int]):
-    from ase.data import chemical_symbols
+@functools.lru_cache(maxsize=16)
+def _chem_symbols_lut(type_map_items: Tuple[Tuple[int, int], ...]) -> np.ndarray:
+    type_map_rev = {v: k for k, v in type_map_items}
+    return np.array(
+        [chemical_symbols[type_map_rev[i]] for i in range(len(type_map_rev))]
+    )
 
-    type_map_rev = {v: k for k, v in type_map.items()}
-    return [chemical_symbols[type_map_rev[x]] for x in one_hot_indices]
 
+def onehot_to_chem(one_hot_indices: List[int], type_map: Dict[int, int]):
+    # one numpy gather instead of two python lookups per atom
+    lut = _chem_symbols_lut(tuple(sorted(type_map.items())))
+    return lut[np.asarray(one_hot_indices)].tolist()
 
-def model_from_checkpoint(
+
+def _model_from_checkpoint(
     checkpoint: str,
+    backend: Optional[str] = None,
 ) -> Tuple[torch.nn.Module, Dict]:
     cp = load_checkpoint(checkpoint)
-    model = cp.build_model()
+    model = cp.build_model(backend)
 
     return model, cp.config
 
 
+def model_from_checkpoint(
+    checkpoint: str,
+) -> Tuple[torch.nn.Module, Dict]:
+    return _model_from_checkpoint(checkpoint)
+
+
 def model_from_checkpoint_with_backend(
     checkpoint: str,
     backend: str = 'e3nn',
 ) -> Tuple[torch.nn.Module, Dict]:
-    cp = load_checkpoint(checkpoint)
-    model = cp.build_model(backend)
-
-    return model, cp.config
+    return _model_from_checkpoint(checkpoint, backend)
 
 
-def unlabeled_atoms_to_input(atoms, cutoff: float, grad_key: str = KEY.EDGE_VEC):
+def unlabeled_atoms_to_input(
+    atoms,
+    cutoff: float,
+    grad_key: str = KEY.EDGE_VEC,
+    requires_grad: bool = True,
+):
     from .atom_graph_data import AtomGraphData
     from .train.dataload import unlabeled_atoms_to_graph
 
     atom_graph = AtomGraphData.from_numpy_dict(
         unlabeled_atoms_to_graph(atoms, cutoff)
     )
-    atom_graph[grad_key].requires_grad_(True)
-    atom_graph[KEY.BATCH] = torch.zeros([0])
+    if requires_grad:  # skip autograd bookkeeping for energy-only inference
+        atom_graph[grad_key].requires_grad_(True)
+    atom_graph[KEY.BATCH] = torch.zeros([0], dtype=torch.long)
     return atom_graph
 
 
 def chemical_species_preprocess(input_chem: List[str], universal: bool = False):
-    from ase.data import atomic_numbers, chemical_symbols
-
     from .nn.node_embedding import get_type_mapper_from_specie
 
     config = {}
@@ -136,28 +152,60 @@ def chemical_species_preprocess(input_chem: List[str], universal: bool = False):
     return config
 
 
+def _dtype_correct_ndarray(v, float_dtype, int_dtype):
+    if v.dtype.kind == 'f':
+        return torch.from_numpy(v).to(float_dtype)
+    elif v.dtype.kind in 'iu':
+        return torch.from_numpy(v).to(int_dtype)
+    return None  # same fall-through as the old isinstance chain
+
+
+def _dtype_correct_tensor(v, float_dtype, int_dtype):
+    if v.dtype.is_floating_point:
+        return v.to(float_dtype)  # convert to specified float dtype
+    else:  # assuming non-floating point tensors are integers
+        return v.to(int_dtype)  # convert to specified int dtype
+
+
+def _dtype_correct_int(v, float_dtype, int_dtype):
+    return torch.tensor(v, dtype=int_dtype)
+
+
+def _dtype_correct_float(v, float_dtype, int_dtype):
+    return torch.tensor(v, dtype=float_dtype)
+
+
+# dispatch by exact type, called for every value during data loading
+_DTYPE_DISPATCH = {
+    np.ndarray: _dtype_correct_ndarray,
+    torch.Tensor: _dtype_correct_tensor,
+    int: _dtype_correct_int,
+    bool: _dtype_correct_int,  # isinstance(True, int) held in the old code
+    float: _dtype_correct_float,
+    np.float64: _dtype_correct_float,  # subclass of float
+}
+
+
 def dtype_correct(
     v: Union[np.ndarray, torch.Tensor, int, float],
     float_dtype: torch.dtype = torch.float32,
     int_dtype: torch.dtype = torch.int64,
 ):
-    if isinstance(v, np.ndarray):
-        if np.issubdtype(v.dtype, np.floating):
-            return torch.from_numpy(v).to(float_dtype)
-        elif np.issubdtype(v.dtype, np.integer):
-            return torch.from_numpy(v).to(int_dtype)
-    elif isinstance(v, torch.Tensor):
-        if v.dtype.is_floating_point:
-            return v.to(float_dtype)  # convert to specified float dtype
-        else:  # assuming non-floating point tensors are integers
-            return v.to(int_dtype)  # convert to specified int dtype
-    else:  # scalar values
-        if isinstance(v, int):
-            return torch.tensor(v, dtype=int_dtype)
-        elif isinstance(v, float):
-            return torch.tensor(v, dtype=float_dtype)
-        else:  # Not numeric
-            return v
+    handler = _DTYPE_DISPATCH.get(type(v))
+    if handler is not None:
+        return handler(v, float_dtype, int_dtype)
+    if isinstance(v, torch.Tensor):  # subclasses miss the type() lookup
+        return _dtype_correct_tensor(v, float_dtype, int_dtype)
+    return v  # Not numeric
+
+
+@functools.lru_cache(maxsize=None)
+def _full_tp_irreps_out(irreps_x: str, irreps_operand: str) -> Irreps:
+    # FullTensorProduct does nontrivial path construction just to get
+    # irreps_out, memoize it. Model build repeats a few (x, operand) pairs
+    return FullTensorProduct(
+        Irreps(irreps_x), Irreps(irreps_operand)
+    ).irreps_out.simplify()
 
 
 def infer_irreps_out(
@@ -169,7 +217,7 @@ def infer_irreps_out(
 ):
     assert parity_mode in ['full', 'even', 'sph']
     # (mul, (ir, p))
-    irreps_out = FullTensorProduct(irreps_x, irreps_operand).irreps_out.simplify()
+    irreps_out = _full_tp_irreps_out(str(irreps_x), str(irreps_operand))
     new_irreps_elem = []
     for mul, (l, p) in irreps_out:  # noqa
         elem = (mul, (l, p))
@@ -186,8 +234,6 @@ def infer_irreps_out(
 
 
 def pretrained_name_to_path(name: str) -> str:
-    import sevenn._const as _const
-
     name = name.lower()
     heads = ['sevennet', '7net']
     checkpoint_path = None